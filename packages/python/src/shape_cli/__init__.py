@@ -9,6 +9,7 @@ import os
 import platform
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 __version__ = "0.0.0"
@@ -16,40 +17,49 @@ __version__ = "0.0.0"
 GITHUB_REPO = "shape-cli/shape"
 BINARY_NAME = "shape.exe" if platform.system() == "Windows" else "shape"
 
+_PACKAGE_DIR = Path(__file__).parent
+_BIN_DIR = _PACKAGE_DIR / "bin"
 
+# Resolved by the first successful get_binary_path() call
+_BINARY_PATH = None
+
+
+# Normalized platform and architecture names, keyed by lowercased
+# platform.system() and platform.machine()
+_OS_NAMES = {"darwin": "darwin", "linux": "linux", "windows": "windows"}
+_ARCH_NAMES = {"x86_64": "x64", "amd64": "x64", "arm64": "arm64", "aarch64": "arm64"}
+
+
+@lru_cache(maxsize=1)
 def get_platform_info():
     """Get the current platform and architecture."""
     system = platform.system().lower()
     machine = platform.machine().lower()
 
-    # Normalize platform names
-    if system == "darwin":
-        os_name = "darwin"
-    elif system == "linux":
-        os_name = "linux"
-    elif system == "windows":
-        os_name = "windows"
-    else:
-        raise RuntimeError(f"Unsupported operating system: {system}")
-
-    # Normalize architecture names
-    if machine in ("x86_64", "amd64"):
-        arch = "x64"
-    elif machine in ("arm64", "aarch64"):
-        arch = "arm64"
-    else:
-        raise RuntimeError(f"Unsupported architecture: {machine}")
+    try:
+        os_name = _OS_NAMES[system]
+    except KeyError:
+        raise RuntimeError(f"Unsupported operating system: {system}") from None
+
+    try:
+        arch = _ARCH_NAMES[machine]
+    except KeyError:
+        raise RuntimeError(f"Unsupported architecture: {machine}") from None
 
     return os_name, arch
 
 
 def get_binary_dir():
     """Get the directory where the binary should be stored."""
-    return Path(__file__).parent / "bin"
+    return _BIN_DIR
 
 
 def get_binary_path():
     """Get the path to the shape binary, downloading if necessary."""
+    global _BINARY_PATH
+    if _BINARY_PATH is not None:
+        return _BINARY_PATH
+
     binary_dir = get_binary_dir()
     binary_path = binary_dir / BINARY_NAME
 
@@ -63,7 +73,8 @@ def get_binary_path():
             "Try reinstalling: pip install --force-reinstall shape-cli"
         )
 
-    return str(binary_path)
+    _BINARY_PATH = str(binary_path)
+    return _BINARY_PATH
 
 
 def main():
@@ -74,16 +85,27 @@ def main():
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Make sure the binary is executable (Unix only)
-    if platform.system() != "Windows":
+    # Make sure the binary is executable (Unix only). The bit is normally
+    # already set at install time, so check before writing the inode.
+    if platform.system() != "Windows" and not os.access(binary_path, os.X_OK):
         os.chmod(binary_path, 0o755)
 
+    argv = [binary_path] + sys.argv[1:]
+
+    # Replace this process with the binary (Unix only), so Python does not
+    # stay resident and signals reach shape directly
+    if platform.system() != "Windows":
+        # Output still buffered here would be lost by exec
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execve(binary_path, argv, os.environ)
+        except OSError:
+            pass  # Fall back to running it as a child process
+
     # Execute the binary with the provided arguments
     try:
-        result = subprocess.run(
-            [binary_path] + sys.argv[1:],
-            env=os.environ,
-        )
+        result = subprocess.run(argv, env=os.environ)
         sys.exit(result.returncode)
     except KeyboardInterrupt:
         sys.exit(130)
@@ -4,26 +4,51 @@ Download script for shape-cli binary.
 This module handles downloading the correct binary for the current platform
 from GitHub releases. Features:
 - Retry logic for network resilience
+- Opt-in ETag-validated cache so reinstalls skip unchanged releases
 - Mandatory checksum verification for security
+
+To install a specific version by hand, run it as a module (it uses
+package-relative imports, so running the file by path does not work):
+
+    python -m shape_cli._download [VERSION]
 """
 
+import email.utils
+import errno
 import hashlib
+import json
+import math
+import os
 import platform
+import random
 import shutil
-import stat
 import sys
 import tarfile
 import tempfile
+import threading
 import time
 import urllib.error
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-GITHUB_REPO = "shape-cli/shape"
+from . import _BIN_DIR, BINARY_NAME, GITHUB_REPO, get_platform_info
+
+if platform.system() == "Windows":
+    import msvcrt
+else:
+    import fcntl
+
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 2
-BINARY_NAME = "shape.exe" if platform.system() == "Windows" else "shape"
+MAX_RETRY_AFTER_SECONDS = 60
+TIMEOUT_SECONDS = 60
+CHUNK_SIZE = 64 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 class DownloadError(Exception):
@@ -36,30 +61,7 @@ class ChecksumError(Exception):
     pass
 
 
-def get_platform_info():
-    """Get the current platform and architecture for download."""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
-
-    if system == "darwin":
-        os_name = "darwin"
-    elif system == "linux":
-        os_name = "linux"
-    elif system == "windows":
-        os_name = "windows"
-    else:
-        raise RuntimeError(f"Unsupported operating system: {system}")
-
-    if machine in ("x86_64", "amd64"):
-        arch = "x64"
-    elif machine in ("arm64", "aarch64"):
-        arch = "arm64"
-    else:
-        raise RuntimeError(f"Unsupported architecture: {machine}")
-
-    return os_name, arch
-
-
+@lru_cache(maxsize=1)
 def get_download_url(version):
     """Get the download URL for the current platform."""
     os_name, arch = get_platform_info()
@@ -72,6 +74,7 @@ def get_download_url(version):
     )
 
 
+@lru_cache(maxsize=1)
 def get_checksum_url(version):
     """Get the checksum file URL."""
     return (
@@ -80,17 +83,113 @@ def get_checksum_url(version):
     )
 
 
-def download_with_retry(url, dest_path):
-    """Download a file from a URL with retry logic."""
+class _Cancelled(Exception):
+    """Raised inside a download worker once its cancel event is set."""
+    pass
+
+
+class _CancellableResponse:
+    """Response wrapper whose reads stop once a cancel event is set."""
+
+    def __init__(self, response, cancel):
+        self._response = response
+        self._cancel = cancel
+        self.headers = response.headers
+
+    def read(self, size=-1):
+        if self._cancel.is_set():
+            raise _Cancelled()
+        return self._response.read(size if size is not None and size >= 0 else None)
+
+
+class _HashingReader:
+    """File-like wrapper that hashes every byte read through it."""
+
+    def __init__(self, fileobj, hasher):
+        self._fileobj = fileobj
+        self._hasher = hasher
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size if size >= 0 else None)
+        self._hasher.update(data)
+        return data
+
+    def drain(self):
+        """Read (and hash) whatever is left in the underlying stream."""
+        for _ in iter(lambda: self.read(CHUNK_SIZE), b""):
+            pass
+
+    def hexdigest(self):
+        return self._hasher.hexdigest()
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Accepts both delta-seconds and HTTP-date forms. Returns None if the
+    value cannot be parsed or is not finite.
+    """
+    try:
+        delay = float(value)
+    except ValueError:
+        pass
+    else:
+        # float() also accepts "nan" and "inf", which time.sleep rejects
+        return max(delay, 0.0) if math.isfinite(delay) else None
+
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+    return max(delay, 0.0)
+
+
+def _retry_delay(attempt, error):
+    """
+    Seconds to wait after a failed attempt.
+
+    Exponential backoff with jitter, unless a 429/503 response asked for
+    a specific delay via Retry-After (capped at MAX_RETRY_AFTER_SECONDS).
+    """
+    if isinstance(error, urllib.error.HTTPError) and error.code in (429, 503):
+        retry_after = error.headers.get("Retry-After") if error.headers else None
+        delay = parse_retry_after(retry_after) if retry_after else None
+        if delay is not None:
+            return min(delay, MAX_RETRY_AFTER_SECONDS)
+
+    return RETRY_DELAY_SECONDS * (2 ** (attempt - 1)) + random.uniform(0, 0.5)
+
+
+def _request_with_retry(url, handler, headers=None, cancel=None):
+    """
+    GET a URL with retry logic and return handler(response).
+
+    The handler runs inside the retry loop, so a failure while consuming
+    the body retries the whole request. A 304 Not Modified reply to a
+    conditional request is raised to the caller as HTTPError. Setting the
+    optional cancel event (a threading.Event) stops the download between
+    reads and retries.
+    """
     last_error = None
 
     for attempt in range(1, MAX_RETRIES + 1):
+        if cancel is not None and cancel.is_set():
+            raise _Cancelled()
         try:
             print(f"Downloading {url} (attempt {attempt}/{MAX_RETRIES})...")
-            urllib.request.urlretrieve(url, dest_path)
-            return
+            request = urllib.request.Request(url, headers=headers or {})
+            with urllib.request.urlopen(request, timeout=TIMEOUT_SECONDS) as response:
+                if cancel is not None:
+                    response = _CancellableResponse(response, cancel)
+                return handler(response)
+        except _Cancelled:
+            raise
         except urllib.error.HTTPError as e:
             last_error = e
+            if e.code == 304:
+                raise
             if e.code == 404:
                 raise DownloadError(f"Release not found: {url}") from e
             print(f"HTTP error {e.code}: {e.reason}")
@@ -102,118 +201,464 @@ def download_with_retry(url, dest_path):
             print(f"Download error: {e}")
 
         if attempt < MAX_RETRIES:
-            print(f"Retrying in {RETRY_DELAY_SECONDS} seconds...")
-            time.sleep(RETRY_DELAY_SECONDS)
+            delay = _retry_delay(attempt, last_error)
+            print(f"Retrying in {delay:.1f} seconds...")
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):
+                raise _Cancelled()
 
     raise DownloadError(
         f"Failed to download {url} after {MAX_RETRIES} attempts"
     ) from last_error
 
 
+def _conditional_headers(etag):
+    return {"If-None-Match": etag} if etag else None
+
+
+def download_with_retry(url, dest_path, hash_name=None, etag=None, cancel=None):
+    """
+    Download a file from a URL with retry logic.
+
+    If hash_name is given (e.g. "sha256"), the body is hashed as it is
+    written. Returns a (hex digest or None, ETag or None) tuple. If etag
+    is given and still current, raises HTTPError with code 304. See
+    _request_with_retry for cancel.
+    """
+    def save(response):
+        hasher = hashlib.new(hash_name) if hash_name else None
+        with open(dest_path, "wb") as f:
+            for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                if hasher:
+                    hasher.update(chunk)
+                f.write(chunk)
+        digest = hasher.hexdigest() if hasher else None
+        return digest, response.headers.get("ETag")
+
+    return _request_with_retry(url, save, _conditional_headers(etag), cancel)
+
+
+def download_and_extract(url, dest_dir, hash_name="sha256", etag=None, cancel=None):
+    """
+    Stream the binary out of a .tar.gz archive at a URL into dest_dir.
+
+    Extraction overlaps the download instead of waiting for the archive
+    to land on disk. Returns a (hex digest, ETag or None) tuple; the
+    caller must verify the digest before trusting anything extracted.
+    If etag is given and still current, raises HTTPError with code 304.
+    See _request_with_retry for cancel.
+    """
+    def extract(response):
+        reader = _HashingReader(response, hashlib.new(hash_name))
+        with tarfile.open(fileobj=reader, mode="r|gz", bufsize=CHUNK_SIZE) as tf:
+            _extract_tar_binary(tf, Path(dest_dir) / BINARY_NAME)
+        # tarfile stops at the end-of-archive marker; hash the trailer too
+        reader.drain()
+        return reader.hexdigest(), response.headers.get("ETag")
+
+    return _request_with_retry(url, extract, _conditional_headers(etag), cancel)
+
+
+def parse_checksums(checksums_content):
+    """
+    Parse checksums.txt into a {filename: hash} dict.
+
+    Accepts "hash  filename", "hash filename" and "hash *filename" lines.
+    Entries are keyed on the basename, so "hash  dist/filename" matches
+    too. The file is ASCII, so it is parsed as bytes without decoding
+    anything; both filenames and hashes stay bytes.
+    """
+    return {
+        parts[-1].lstrip(b"*").rsplit(b"/", 1)[-1]: parts[0]
+        for line in checksums_content.splitlines()
+        if len(parts := line.split()) >= 2
+    }
+
+
+def verify_digest(actual_hash, checksums_content, expected_filename):
+    """
+    Verify a SHA256 hex digest against its entry in checksums.txt.
+
+    Raises ChecksumError if verification fails.
+    """
+    actual_hash = actual_hash.lower()
+    checksums = parse_checksums(checksums_content)
+    expected_hash = checksums.get(expected_filename.encode())
+
+    if expected_hash is None:
+        raise ChecksumError(
+            f"No checksum found for {expected_filename} in checksums.txt"
+        )
+
+    # Only the entry we need is decoded, so a malformed line for another
+    # file cannot break verification
+    try:
+        expected_hash = expected_hash.decode("ascii").lower()
+    except UnicodeDecodeError:
+        raise ChecksumError(
+            f"Malformed checksum for {expected_filename} in checksums.txt"
+        ) from None
+
+    if actual_hash != expected_hash:
+        raise ChecksumError(
+            f"Checksum mismatch for {expected_filename}:\n"
+            f"  Expected: {expected_hash}\n"
+            f"  Actual:   {actual_hash}"
+        )
+
+    print(f"Checksum verified: {expected_filename}")
+
+
 def verify_checksum(file_path, checksums_content, expected_filename):
     """
     Verify the SHA256 checksum of a file.
 
     Raises ChecksumError if verification fails.
     """
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-    actual_hash = sha256_hash.hexdigest().lower()
+    # Unbuffered: reads go straight to the OS in large chunks
+    with open(file_path, "rb", buffering=0) as f:
+        if sys.version_info >= (3, 11):
+            sha256_hash = hashlib.file_digest(f, "sha256")
+        else:
+            sha256_hash = hashlib.sha256()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                sha256_hash.update(chunk)
 
-    # Parse checksums file (format: "hash  filename" or "hash filename")
-    for line in checksums_content.decode("utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
+    verify_digest(sha256_hash.hexdigest(), checksums_content, expected_filename)
 
-        # Handle both "hash  filename" and "hash filename" formats
-        parts = line.split()
-        if len(parts) >= 2 and expected_filename in parts[-1]:
-            expected_hash = parts[0].lower()
-            if actual_hash == expected_hash:
-                print(f"Checksum verified: {expected_filename}")
-                return
-            raise ChecksumError(
-                f"Checksum mismatch for {expected_filename}:\n"
-                f"  Expected: {expected_hash}\n"
-                f"  Actual:   {actual_hash}"
-            )
 
-    raise ChecksumError(f"No checksum found for {expected_filename} in checksums.txt")
+def _is_binary_member(name):
+    """Whether an archive member name refers to the shape binary."""
+    return name.replace("\\", "/").rsplit("/", 1)[-1] == BINARY_NAME
+
+
+def _extract_tar_binary(tf, binary_path):
+    """
+    Write the binary member of an open tar archive to binary_path.
+
+    Works in streaming mode: members are visited once, in order.
+    """
+    for member in tf:
+        if member.isfile() and _is_binary_member(member.name):
+            with tf.extractfile(member) as src, open(binary_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            return
 
 
 def extract_binary(archive_path, dest_dir):
-    """Extract the binary from the archive."""
+    """Extract the binary (and only the binary) from the archive."""
     os_name, _ = get_platform_info()
+    binary_path = dest_dir / BINARY_NAME
 
     if os_name == "windows":
         with zipfile.ZipFile(archive_path, "r") as zf:
-            zf.extractall(dest_dir)
+            member = next(
+                (n for n in zf.namelist() if _is_binary_member(n)), None
+            )
+            if member is not None:
+                with zf.open(member) as src, open(binary_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, CHUNK_SIZE)
     else:
         with tarfile.open(archive_path, "r:gz") as tf:
-            tf.extractall(dest_dir)
+            _extract_tar_binary(tf, binary_path)
 
-    binary_path = dest_dir / BINARY_NAME
     if not binary_path.exists():
         raise RuntimeError(f"Binary not found in archive: {binary_path}")
 
     return binary_path
 
 
-def install_binary(version):
-    """Download and install the shape binary."""
-    # Determine installation directory
-    package_dir = Path(__file__).parent
-    bin_dir = package_dir / "bin"
-    bin_dir.mkdir(exist_ok=True)
+CACHE_META_NAME = ".install-meta.json"
 
-    dest_binary = bin_dir / BINARY_NAME
 
-    # Skip if already installed
-    if dest_binary.exists():
-        return str(dest_binary)
+def get_cache_dir():
+    """
+    Get the directory where verified binaries are cached, or None.
+
+    The cache is opt-in: it is only used when SHAPE_CLI_CACHE_DIR is set.
+    It lives outside the package so it survives pip reinstalls.
+    """
+    cache_dir = os.environ.get("SHAPE_CLI_CACHE_DIR")
+    return Path(cache_dir) if cache_dir else None
+
+
+def _load_cached_binary(version, archive_name):
+    """Return (metadata, binary path) for a cached release, or None."""
+    cache_root = get_cache_dir()
+    if cache_root is None:
+        return None
+
+    cache_dir = cache_root / version
+    try:
+        with open(cache_dir / CACHE_META_NAME, "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    cached_binary = cache_dir / BINARY_NAME
+    if (
+        meta.get("version") != version
+        or meta.get("archive") != archive_name
+        or not meta.get("etag")
+        or not meta.get("sha256")
+        or not meta.get("binary_sha256")
+        or not cached_binary.exists()
+    ):
+        return None
+    return meta, cached_binary
+
+
+def _copy_hashed(src_path, dest_path):
+    """Copy src_path to dest_path and return the SHA256 of the bytes copied."""
+    hasher = hashlib.sha256()
+    with open(src_path, "rb") as src, open(dest_path, "wb") as dst:
+        for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+            dst.write(chunk)
+    return hasher.hexdigest()
+
+
+def _replace_from_temp(dest_path, write):
+    """
+    Atomically replace dest_path with a file produced by write(tmp_path).
+
+    The temporary name is unique, so concurrent writers (e.g. two
+    virtualenvs sharing a cache) never clobber each other's staging file.
+    Returns whatever write returns.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{dest_path.name}-", suffix=".tmp", dir=str(dest_path.parent)
+    )
+    os.close(fd)
+    try:
+        result = write(tmp_name)
+        os.replace(tmp_name, str(dest_path))
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return result
+
+
+def _prune_cache(cache_root, keep_version):
+    """Remove cached binaries for every version except keep_version."""
+    for entry in cache_root.iterdir():
+        if entry.name == keep_version or not (entry / CACHE_META_NAME).exists():
+            continue
+        # Only remove files this module writes, never anything else
+        for name in (CACHE_META_NAME, BINARY_NAME):
+            try:
+                (entry / name).unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            entry.rmdir()
+        except OSError:
+            pass
 
+
+def _store_cached_binary(version, archive_name, binary_path, etag, sha256):
+    """
+    Cache a verified binary, if caching is enabled.
+
+    The metadata records the ETag and SHA256 of the release archive it came
+    from, plus the SHA256 of the binary itself so it can be re-verified
+    before reuse. Binaries cached for other versions are pruned.
+    """
+    cache_root = get_cache_dir()
+    if cache_root is None:
+        return
+
+    cache_dir = cache_root / version
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        binary_sha256 = _replace_from_temp(
+            cache_dir / BINARY_NAME,
+            lambda tmp_name: _copy_hashed(binary_path, tmp_name),
+        )
+        meta = {
+            "etag": etag,
+            "sha256": sha256,
+            "binary_sha256": binary_sha256,
+            "version": version,
+            "archive": archive_name,
+        }
+
+        def write_meta(tmp_name):
+            with open(tmp_name, "w") as f:
+                json.dump(meta, f)
+
+        _replace_from_temp(cache_dir / CACHE_META_NAME, write_meta)
+        _prune_cache(cache_root, version)
+    except OSError as e:
+        # The cache is an optimization; never fail an install over it
+        print(f"Could not cache binary: {e}")
+
+
+def _restore_cached_binary(meta, cached_binary, dest_path):
+    """
+    Copy a cached binary to dest_path, re-hashing it on the way.
+
+    Returns False if it cannot be read or no longer matches the SHA256
+    recorded when it was cached.
+    """
+    try:
+        return _copy_hashed(cached_binary, dest_path) == meta["binary_sha256"]
+    except OSError:
+        return False
+
+
+@contextmanager
+def _install_lock(lock_path):
+    """Hold an exclusive lock on lock_path, shared across processes."""
+    fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        if platform.system() == "Windows":
+            # LK_LOCK gives up with EDEADLOCK after ~10 seconds; keep
+            # waiting on that, but surface any other failure
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as e:
+                    if e.errno != errno.EDEADLOCK:
+                        raise
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            # Released when fd is closed
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+    finally:
+        os.close(fd)
+
+
+def _download_binary(version, dest_binary):
+    """Download, verify and extract the binary to dest_binary."""
     os_name, arch = get_platform_info()
     platform_name = f"{os_name}-{arch}"
     ext = "zip" if os_name == "windows" else "tar.gz"
     archive_name = f"shape-{platform_name}.{ext}"
 
-    with tempfile.TemporaryDirectory() as tmpdir:
+    # Work inside bin_dir so the final move is a same-filesystem rename
+    # rather than a copy out of the system temp directory
+    bin_dir = dest_binary.parent
+    with tempfile.TemporaryDirectory(prefix=".tmp-", dir=str(bin_dir)) as tmpdir:
         tmpdir = Path(tmpdir)
 
-        # Download archive with retry
+        # Download archive and checksums (mandatory) concurrently
         archive_path = tmpdir / archive_name
         download_url = get_download_url(version)
-        download_with_retry(download_url, archive_path)
-
-        # Download and verify checksum (mandatory)
-        checksums_url = get_checksum_url(version)
         checksums_path = tmpdir / "checksums.txt"
-        download_with_retry(checksums_url, checksums_path)
+        checksums_url = get_checksum_url(version)
+        extract_dir = tmpdir / "extract"
+        extract_dir.mkdir()
 
+        def fetch_archive(etag=None, cancel=None):
+            if os_name == "windows":
+                # Zip needs a seekable file, so download it first
+                return download_with_retry(
+                    download_url, archive_path, "sha256", etag, cancel
+                )
+            return download_and_extract(
+                download_url, extract_dir, "sha256", etag, cancel
+            )
+
+        # A cached binary from an earlier install is reused if the release
+        # asset is unchanged (304 to If-None-Match)
+        cached = _load_cached_binary(version, archive_name)
+        etag = cached[0]["etag"] if cached else None
+
+        cancel = threading.Event()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            archive_future = executor.submit(fetch_archive, etag, cancel)
+            checksums_future = executor.submit(
+                download_with_retry, checksums_url, checksums_path
+            )
+            try:
+                checksums_future.result()
+            except BaseException:
+                # Without checksums the archive is useless; stop it instead
+                # of waiting out its retries when the executor shuts down
+                cancel.set()
+                raise
+            try:
+                archive_hash, archive_etag = archive_future.result()
+                from_cache = False
+            except urllib.error.HTTPError as e:
+                if e.code != 304 or not cached:
+                    raise
+                from_cache = True
+
+        binary_path = extract_dir / BINARY_NAME
+        if from_cache:
+            meta, cached_binary = cached
+            if _restore_cached_binary(meta, cached_binary, binary_path):
+                print(f"Release unchanged, using cached binary: {cached_binary}")
+                archive_hash, archive_etag = meta["sha256"], etag
+            else:
+                print("Cached binary failed verification, downloading again")
+                from_cache = False
+                archive_hash, archive_etag = fetch_archive()
+
+        # Verify checksum. For a cached binary this checks the archive it
+        # was extracted from; the binary itself was re-hashed above. On
+        # mismatch, anything already extracted is discarded with tmpdir
+        # and never reaches bin_dir.
         with open(checksums_path, "rb") as f:
             checksums_content = f.read()
 
-        verify_checksum(archive_path, checksums_content, archive_name)
+        verify_digest(archive_hash, checksums_content, archive_name)
 
         # Extract binary
-        extract_dir = tmpdir / "extract"
-        extract_dir.mkdir()
-        binary_path = extract_binary(archive_path, extract_dir)
+        if not from_cache:
+            if os_name == "windows":
+                binary_path = extract_binary(archive_path, extract_dir)
+            elif not binary_path.exists():
+                raise RuntimeError(f"Binary not found in archive: {binary_path}")
 
-        # Move to final destination
-        shutil.move(str(binary_path), str(dest_binary))
+            if archive_etag:
+                _store_cached_binary(
+                    version, archive_name, binary_path, archive_etag, archive_hash
+                )
 
         # Make executable (Unix only)
         if os_name != "windows":
-            dest_binary.chmod(dest_binary.stat().st_mode | stat.S_IEXEC)
+            os.chmod(binary_path, 0o755)
+
+        # Atomic rename into place so readers never see a partial binary
+        os.replace(str(binary_path), str(dest_binary))
+
+
+def install_binary(version):
+    """Download and install the shape binary."""
+    bin_dir = _BIN_DIR
+    bin_dir.mkdir(exist_ok=True)
+
+    dest_binary = bin_dir / BINARY_NAME
+
+    # Skip if already installed
+    if dest_binary.exists():
+        return str(dest_binary)
+
+    with _install_lock(bin_dir / ".install.lock"):
+        # Another process may have installed it while we waited
+        if dest_binary.exists():
+            return str(dest_binary)
+
+        _download_binary(version, dest_binary)
 
     print(f"Installed shape binary to {dest_binary}")
     return str(dest_binary)
 
 
+# Must be run as `python -m shape_cli._download`, not by file path
 if __name__ == "__main__":
     version = sys.argv[1] if len(sys.argv) > 1 else "0.0.0"
     install_binary(version)
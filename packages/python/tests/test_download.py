@@ -1,21 +1,52 @@
 """Tests for shape_cli download functionality."""
 
 import hashlib
-import tempfile
+import io
+import tarfile
+import threading
+import urllib.error
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from shape_cli._download import (
+    BINARY_NAME,
     ChecksumError,
     DownloadError,
+    download_and_extract,
+    _Cancelled,
+    _download_binary,
+    _install_lock,
+    _request_with_retry,
+    _retry_delay,
+    _load_cached_binary,
+    _store_cached_binary,
+    extract_binary,
+    get_cache_dir,
+    get_checksum_url,
     get_download_url,
     get_platform_info,
+    install_binary,
+    parse_checksums,
+    parse_retry_after,
     verify_checksum,
+    verify_digest,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset memoized platform and URL lookups around each test."""
+    for fn in (get_platform_info, get_download_url, get_checksum_url):
+        fn.cache_clear()
+    yield
+    for fn in (get_platform_info, get_download_url, get_checksum_url):
+        fn.cache_clear()
+
+
 class TestGetPlatformInfo:
     """Tests for platform detection."""
 
@@ -87,81 +118,444 @@ class TestGetDownloadUrl:
         assert url == "https://github.com/shape-cli/shape/releases/download/v1.2.3/shape-windows-x64.zip"
 
 
+@pytest.fixture(scope="module")
+def test_content_file(tmp_path_factory):
+    """A file containing b"test content", shared by checksum tests."""
+    path = tmp_path_factory.mktemp("checksum") / "test-file"
+    path.write_bytes(b"test content")
+    return path
+
+
 class TestVerifyChecksum:
     """Tests for checksum verification."""
 
-    def test_valid_checksum(self):
+    def test_valid_checksum(self, test_content_file):
         """Test that valid checksum passes."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(b"test content")
-            f.flush()
-            file_path = Path(f.name)
-
-        try:
-            expected_hash = hashlib.sha256(b"test content").hexdigest()
-            checksums = f"{expected_hash}  test-file.tar.gz\n".encode()
-            # Should not raise
-            verify_checksum(file_path, checksums, "test-file.tar.gz")
-        finally:
-            file_path.unlink()
-
-    def test_invalid_checksum(self):
+        expected_hash = hashlib.sha256(b"test content").hexdigest()
+        checksums = f"{expected_hash}  test-file.tar.gz\n".encode()
+        # Should not raise
+        verify_checksum(test_content_file, checksums, "test-file.tar.gz")
+
+    def test_invalid_checksum(self, test_content_file):
         """Test that invalid checksum raises error."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(b"test content")
-            f.flush()
-            file_path = Path(f.name)
-
-        try:
-            wrong_hash = "a" * 64
-            checksums = f"{wrong_hash}  test-file.tar.gz\n".encode()
-            with pytest.raises(ChecksumError, match="Checksum mismatch"):
-                verify_checksum(file_path, checksums, "test-file.tar.gz")
-        finally:
-            file_path.unlink()
-
-    def test_missing_checksum(self):
+        wrong_hash = "a" * 64
+        checksums = f"{wrong_hash}  test-file.tar.gz\n".encode()
+        with pytest.raises(ChecksumError, match="Checksum mismatch"):
+            verify_checksum(test_content_file, checksums, "test-file.tar.gz")
+
+    def test_missing_checksum(self, test_content_file):
         """Test that missing checksum raises error."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(b"test content")
-            f.flush()
-            file_path = Path(f.name)
-
-        try:
-            checksums = b"abc123  other-file.tar.gz\n"
-            with pytest.raises(ChecksumError, match="No checksum found"):
-                verify_checksum(file_path, checksums, "test-file.tar.gz")
-        finally:
-            file_path.unlink()
-
-    def test_checksum_format_with_single_space(self):
+        checksums = b"abc123  other-file.tar.gz\n"
+        with pytest.raises(ChecksumError, match="No checksum found"):
+            verify_checksum(test_content_file, checksums, "test-file.tar.gz")
+
+    def test_checksum_format_with_single_space(self, test_content_file):
         """Test checksum parsing with single space separator."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(b"test content")
-            f.flush()
-            file_path = Path(f.name)
-
-        try:
-            expected_hash = hashlib.sha256(b"test content").hexdigest()
-            # Single space instead of double
-            checksums = f"{expected_hash} test-file.tar.gz\n".encode()
-            verify_checksum(file_path, checksums, "test-file.tar.gz")
-        finally:
-            file_path.unlink()
-
-    def test_checksum_case_insensitive(self):
+        expected_hash = hashlib.sha256(b"test content").hexdigest()
+        # Single space instead of double
+        checksums = f"{expected_hash} test-file.tar.gz\n".encode()
+        verify_checksum(test_content_file, checksums, "test-file.tar.gz")
+
+    def test_checksum_case_insensitive(self, test_content_file):
         """Test that checksum comparison is case-insensitive."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(b"test content")
-            f.flush()
-            file_path = Path(f.name)
-
-        try:
-            expected_hash = hashlib.sha256(b"test content").hexdigest().upper()
-            checksums = f"{expected_hash}  test-file.tar.gz\n".encode()
-            verify_checksum(file_path, checksums, "test-file.tar.gz")
-        finally:
-            file_path.unlink()
+        expected_hash = hashlib.sha256(b"test content").hexdigest().upper()
+        checksums = f"{expected_hash}  test-file.tar.gz\n".encode()
+        verify_checksum(test_content_file, checksums, "test-file.tar.gz")
+
+
+class TestParseChecksums:
+    """Tests for checksums.txt parsing."""
+
+    def test_parses_entries(self):
+        checksums = (
+            b"AAAA  shape-linux-x64.tar.gz\n"
+            b"\n"
+            b"bbbb *shape-windows-x64.zip\n"
+        )
+        assert parse_checksums(checksums) == {
+            b"shape-linux-x64.tar.gz": b"AAAA",
+            b"shape-windows-x64.zip": b"bbbb",
+        }
+
+    def test_path_prefixed_entry(self):
+        """Test that entries are matched on their basename."""
+        digest = hashlib.sha256(b"test content").hexdigest()
+        checksums = f"{digest}  dist/test-file.tar.gz\n".encode()
+        verify_digest(digest, checksums, "test-file.tar.gz")
+
+    def test_non_ascii_line_for_other_file(self):
+        """Test that a malformed entry for another file is ignored."""
+        digest = hashlib.sha256(b"test content").hexdigest()
+        checksums = (
+            b"\xef\xbb\xbfabcd  other-file.zip\n"
+            + f"{digest}  test-file.tar.gz\n".encode()
+        )
+        verify_digest(digest, checksums, "test-file.tar.gz")
+
+    def test_non_ascii_hash_raises_checksum_error(self):
+        """Test that a malformed expected hash raises ChecksumError."""
+        checksums = b"\xef\xbb\xbfabcd  test-file.tar.gz\n"
+        with pytest.raises(ChecksumError, match="Malformed checksum"):
+            verify_digest("abcd", checksums, "test-file.tar.gz")
+
+    def test_no_prefix_match(self):
+        """Test that a filename does not match a longer entry."""
+        digest = hashlib.sha256(b"test content").hexdigest()
+        checksums = f"{digest}  test-file.tar.gz.sig\n".encode()
+        with pytest.raises(ChecksumError, match="No checksum found"):
+            verify_digest(digest, checksums, "test-file.tar.gz")
+
+
+class TestVerifyDigest:
+    """Tests for verifying a precomputed digest."""
+
+    def test_valid_digest(self):
+        """Test that a matching digest passes."""
+        digest = hashlib.sha256(b"test content").hexdigest()
+        checksums = f"{digest}  test-file.tar.gz\n".encode()
+        verify_digest(digest, checksums, "test-file.tar.gz")
+
+    def test_invalid_digest(self):
+        """Test that a mismatched digest raises error."""
+        digest = hashlib.sha256(b"test content").hexdigest()
+        checksums = f"{'a' * 64}  test-file.tar.gz\n".encode()
+        with pytest.raises(ChecksumError, match="Checksum mismatch"):
+            verify_digest(digest, checksums, "test-file.tar.gz")
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after("30") == 30.0
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid(self):
+        assert parse_retry_after("soon") is None
+
+    @pytest.mark.parametrize("value", ["nan", "inf", "-inf"])
+    def test_not_finite(self, value):
+        assert parse_retry_after(value) is None
+
+
+def _http_error(code, retry_after=None):
+    headers = {"Retry-After": retry_after} if retry_after else {}
+    return urllib.error.HTTPError("https://example.com", code, "error", headers, None)
+
+
+class TestRetryDelay:
+    """Tests for the delay between download retries."""
+
+    @patch("random.uniform", return_value=0.25)
+    def test_exponential_backoff(self, mock_uniform):
+        assert _retry_delay(1, None) == 2.25
+        assert _retry_delay(2, None) == 4.25
+        assert _retry_delay(3, None) == 8.25
+
+    def test_jitter_bounds(self):
+        for _ in range(20):
+            assert 2 <= _retry_delay(1, None) <= 2.5
+
+    @pytest.mark.parametrize("code", [429, 503])
+    def test_retry_after_override(self, code):
+        assert _retry_delay(1, _http_error(code, "7")) == 7
+
+    def test_retry_after_capped(self):
+        assert _retry_delay(1, _http_error(429, "3600")) == 60
+
+    @patch("random.uniform", return_value=0.25)
+    def test_retry_after_ignored_for_other_codes(self, mock_uniform):
+        assert _retry_delay(1, _http_error(500, "7")) == 2.25
+
+    @patch("random.uniform", return_value=0.25)
+    def test_invalid_retry_after_falls_back(self, mock_uniform):
+        assert _retry_delay(1, _http_error(503, "nan")) == 2.25
+
+
+class TestExtractBinary:
+    """Tests for extracting the binary from release archives."""
+
+    @patch("shape_cli._download.get_platform_info")
+    def test_tar_extracts_only_binary(self, mock_platform, tmp_path):
+        mock_platform.return_value = ("linux", "x64")
+        archive = tmp_path / "shape.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            for name, data in (("LICENSE", b"MIT"), (BINARY_NAME, b"binary")):
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+        dest = tmp_path / "extract"
+        dest.mkdir()
+
+        binary_path = extract_binary(archive, dest)
+
+        assert binary_path.read_bytes() == b"binary"
+        assert sorted(p.name for p in dest.iterdir()) == [BINARY_NAME]
+
+    @patch("shape_cli._download.get_platform_info")
+    def test_zip_extracts_only_binary(self, mock_platform, tmp_path):
+        mock_platform.return_value = ("windows", "x64")
+        archive = tmp_path / "shape.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("README.md", b"readme")
+            zf.writestr(f"dist/{BINARY_NAME}", b"binary")
+        dest = tmp_path / "extract"
+        dest.mkdir()
+
+        binary_path = extract_binary(archive, dest)
+
+        assert binary_path.read_bytes() == b"binary"
+        assert sorted(p.name for p in dest.iterdir()) == [BINARY_NAME]
+
+    @patch("shape_cli._download.get_platform_info")
+    def test_missing_binary(self, mock_platform, tmp_path):
+        mock_platform.return_value = ("windows", "x64")
+        archive = tmp_path / "shape.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("README.md", b"readme")
+        dest = tmp_path / "extract"
+        dest.mkdir()
+
+        with pytest.raises(RuntimeError, match="Binary not found"):
+            extract_binary(archive, dest)
+
+
+class _FakeResponse(io.BytesIO):
+    """An in-memory stand-in for an HTTP response."""
+
+    headers = {"ETag": '"etag"'}
+
+
+class TestDownloadAndExtract:
+    """Tests for streaming extraction of tar.gz releases."""
+
+    def test_streams_binary_and_hashes_whole_archive(self, tmp_path):
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+            for name, data in (("LICENSE", b"MIT"), (BINARY_NAME, b"binary")):
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+        # Padding larger than the read size, which tarfile itself never reads
+        archive = buf.getvalue() + b"\0" * (256 * 1024)
+        dest = tmp_path / "extract"
+        dest.mkdir()
+
+        with patch("urllib.request.urlopen", return_value=_FakeResponse(archive)):
+            digest, etag = download_and_extract("https://example.com/a.tar.gz", dest)
+
+        assert digest == hashlib.sha256(archive).hexdigest()
+        assert etag == '"etag"'
+        assert sorted(p.name for p in dest.iterdir()) == [BINARY_NAME]
+        assert (dest / BINARY_NAME).read_bytes() == b"binary"
+
+    def test_crafted_archive_stays_in_dest(self, tmp_path):
+        """Test that unverified members cannot write outside dest_dir."""
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+            escape = tarfile.TarInfo("../escaped")
+            escape.size = 4
+            tf.addfile(escape, io.BytesIO(b"evil"))
+            link = tarfile.TarInfo(BINARY_NAME)
+            link.type = tarfile.SYMTYPE
+            link.linkname = str(tmp_path / "target")
+            tf.addfile(link)
+        dest = tmp_path / "extract"
+        dest.mkdir()
+
+        with patch("urllib.request.urlopen", return_value=_FakeResponse(buf.getvalue())):
+            download_and_extract("https://example.com/a.tar.gz", dest)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["extract"]
+        assert list(dest.iterdir()) == []
+
+
+class TestCancel:
+    """Tests for stopping the archive download when checksums fail."""
+
+    def test_cancel_interrupts_retry_backoff(self):
+        cancel = threading.Event()
+        threading.Timer(0.1, cancel.set).start()
+
+        with patch("urllib.request.urlopen", side_effect=urllib.error.URLError("down")), \
+                patch("shape_cli._download._retry_delay", return_value=30):
+            with pytest.raises(_Cancelled):
+                _request_with_retry("https://example.com/a", lambda r: None, cancel=cancel)
+
+    @patch("shape_cli._download.get_platform_info", return_value=("linux", "x64"))
+    def test_checksums_failure_cancels_archive(self, mock_platform, tmp_path, monkeypatch):
+        monkeypatch.delenv("SHAPE_CLI_CACHE_DIR", raising=False)
+        archive_cancelled = threading.Event()
+
+        def fake_download(url, dest_path, hash_name=None, etag=None, cancel=None):
+            raise DownloadError("checksums unavailable")
+
+        def fake_extract(url, dest_dir, hash_name="sha256", etag=None, cancel=None):
+            if cancel.wait(5):
+                archive_cancelled.set()
+                raise _Cancelled()
+            return "digest", None
+
+        with patch("shape_cli._download.download_with_retry", fake_download), \
+                patch("shape_cli._download.download_and_extract", fake_extract):
+            with pytest.raises(DownloadError, match="checksums unavailable"):
+                _download_binary("1.2.3", tmp_path / BINARY_NAME)
+
+        assert archive_cancelled.is_set()
+
+
+class TestInstallLock:
+    """Tests for serializing concurrent installs."""
+
+    def test_lock_is_exclusive(self, tmp_path):
+        lock_path = tmp_path / ".install.lock"
+        acquired = threading.Event()
+
+        def contender():
+            with _install_lock(lock_path):
+                acquired.set()
+
+        with _install_lock(lock_path):
+            thread = threading.Thread(target=contender)
+            thread.start()
+            assert not acquired.wait(0.2)
+
+        assert acquired.wait(5)
+        thread.join()
+
+    def test_lock_file_not_executable(self, tmp_path):
+        lock_path = tmp_path / ".install.lock"
+        with _install_lock(lock_path):
+            pass
+        assert lock_path.stat().st_mode & 0o111 == 0
+
+    def test_rechecks_binary_after_lock(self, tmp_path):
+        dest_binary = tmp_path / BINARY_NAME
+
+        @contextmanager
+        def lock_while_other_install_finishes(lock_path):
+            with _install_lock(lock_path):
+                # Another process installed the binary while we waited
+                dest_binary.write_bytes(b"binary")
+                yield
+
+        with patch("shape_cli._download._BIN_DIR", tmp_path), \
+                patch("shape_cli._download._install_lock", lock_while_other_install_finishes), \
+                patch("shape_cli._download._download_binary") as mock_download:
+            assert install_binary("1.2.3") == str(dest_binary)
+
+        mock_download.assert_not_called()
+
+
+class TestBinaryCache:
+    """Tests for the ETag-validated binary cache."""
+
+    def test_cache_dir_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SHAPE_CLI_CACHE_DIR", str(tmp_path))
+        assert get_cache_dir() == tmp_path
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("SHAPE_CLI_CACHE_DIR", raising=False)
+        binary = tmp_path / BINARY_NAME
+        binary.write_bytes(b"binary")
+
+        assert get_cache_dir() is None
+        _store_cached_binary("1.2.3", "shape-linux-x64.tar.gz", binary, '"etag"', "abc")
+        assert _load_cached_binary("1.2.3", "shape-linux-x64.tar.gz") is None
+        assert sorted(p.name for p in tmp_path.iterdir()) == [BINARY_NAME]
+
+    def test_store_and_load(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SHAPE_CLI_CACHE_DIR", str(tmp_path / "cache"))
+        binary = tmp_path / BINARY_NAME
+        binary.write_bytes(b"binary")
+
+        _store_cached_binary("1.2.3", "shape-linux-x64.tar.gz", binary, '"etag"', "abc")
+
+        meta, cached_binary = _load_cached_binary("1.2.3", "shape-linux-x64.tar.gz")
+        assert meta["etag"] == '"etag"'
+        assert meta["sha256"] == "abc"
+        assert meta["binary_sha256"] == hashlib.sha256(b"binary").hexdigest()
+        assert cached_binary.read_bytes() == b"binary"
+
+    def test_load_ignores_other_archive(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SHAPE_CLI_CACHE_DIR", str(tmp_path / "cache"))
+        binary = tmp_path / BINARY_NAME
+        binary.write_bytes(b"binary")
+
+        _store_cached_binary("1.2.3", "shape-linux-x64.tar.gz", binary, '"etag"', "abc")
+
+        assert _load_cached_binary("1.2.3", "shape-linux-arm64.tar.gz") is None
+        assert _load_cached_binary("1.2.4", "shape-linux-x64.tar.gz") is None
+
+    def test_store_prunes_other_versions(self, tmp_path, monkeypatch):
+        cache = tmp_path / "cache"
+        monkeypatch.setenv("SHAPE_CLI_CACHE_DIR", str(cache))
+        (cache / "unrelated").mkdir(parents=True)
+        binary = tmp_path / BINARY_NAME
+        binary.write_bytes(b"binary")
+
+        _store_cached_binary("1.2.3", "shape-linux-x64.tar.gz", binary, '"etag"', "abc")
+        _store_cached_binary("1.2.4", "shape-linux-x64.tar.gz", binary, '"etag"', "abc")
+
+        assert sorted(p.name for p in cache.iterdir()) == ["1.2.4", "unrelated"]
+        assert sorted(p.name for p in (cache / "1.2.4").iterdir()) == [
+            ".install-meta.json",
+            BINARY_NAME,
+        ]
+
+
+ARCHIVE_NAME = "shape-linux-x64.tar.gz"
+ARCHIVE_HASH = hashlib.sha256(b"archive").hexdigest()
+
+
+@patch("shape_cli._download.get_platform_info", return_value=("linux", "x64"))
+class TestDownloadBinaryCache:
+    """Tests for reusing a cached binary when the release is unchanged."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SHAPE_CLI_CACHE_DIR", str(tmp_path / "cache"))
+        self.bin_dir = tmp_path / "bin"
+        self.bin_dir.mkdir()
+        self.dest_binary = self.bin_dir / BINARY_NAME
+        self.extract_etags = []
+
+        source = tmp_path / "source"
+        source.write_bytes(b"cached")
+        _store_cached_binary("1.2.3", ARCHIVE_NAME, source, '"etag"', ARCHIVE_HASH)
+        self.cached_binary = tmp_path / "cache" / "1.2.3" / BINARY_NAME
+
+    def _fake_download(self, url, dest_path, hash_name=None, etag=None, cancel=None):
+        Path(dest_path).write_bytes(f"{ARCHIVE_HASH}  {ARCHIVE_NAME}\n".encode())
+        return None, None
+
+    def _fake_extract(self, url, dest_dir, hash_name="sha256", etag=None, cancel=None):
+        self.extract_etags.append(etag)
+        if etag == '"etag"':
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+        (Path(dest_dir) / BINARY_NAME).write_bytes(b"fresh")
+        return ARCHIVE_HASH, '"etag"'
+
+    def _run(self):
+        with patch("shape_cli._download.download_with_retry", self._fake_download), \
+                patch("shape_cli._download.download_and_extract", self._fake_extract):
+            _download_binary("1.2.3", self.dest_binary)
+
+    def test_not_modified_reuses_cached_binary(self, mock_platform):
+        self._run()
+
+        assert self.dest_binary.read_bytes() == b"cached"
+        assert self.extract_etags == ['"etag"']
+
+    def test_tampered_cache_downloads_again(self, mock_platform):
+        self.cached_binary.write_bytes(b"tampered")
+
+        self._run()
+
+        assert self.dest_binary.read_bytes() == b"fresh"
+        assert self.extract_etags == ['"etag"', None]
 
 
 if __name__ == "__main__":
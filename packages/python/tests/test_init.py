@@ -0,0 +1,142 @@
+"""Tests for the shape_cli entry point."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+import shape_cli
+
+BINARY_PATH = "/opt/shape/bin/shape"
+
+
+class _Exec(Exception):
+    """Stands in for os.execve never returning."""
+    pass
+
+
+@pytest.fixture
+def cli(monkeypatch):
+    """Run main() against a fixed binary path on a given platform."""
+    monkeypatch.setattr("sys.argv", ["shape", "ready", "--json"])
+    monkeypatch.setattr(shape_cli, "get_binary_path", lambda: BINARY_PATH)
+    monkeypatch.setattr(os, "access", lambda path, mode: True)
+
+    def set_platform(system):
+        monkeypatch.setattr("platform.system", lambda: system)
+
+    return set_platform
+
+
+class TestMainExec:
+    """Tests for handing off to the binary."""
+
+    def test_execs_binary_with_argv(self, cli):
+        cli("Linux")
+        with patch("os.execve", side_effect=_Exec) as mock_execve:
+            with pytest.raises(_Exec):
+                shape_cli.main()
+
+        mock_execve.assert_called_once_with(
+            BINARY_PATH, [BINARY_PATH, "ready", "--json"], os.environ
+        )
+
+    def test_flushes_output_before_exec(self, cli):
+        cli("Linux")
+        calls = Mock()
+        with patch("sys.stdout", calls.stdout), \
+                patch("sys.stderr", calls.stderr), \
+                patch("os.execve", calls.execve):
+            calls.execve.side_effect = _Exec
+            with pytest.raises(_Exec):
+                shape_cli.main()
+
+        names = [name for name, _, _ in calls.mock_calls]
+        assert names.index("stdout.flush") < names.index("execve")
+        assert names.index("stderr.flush") < names.index("execve")
+
+    def test_falls_back_to_subprocess_on_exec_error(self, cli):
+        cli("Linux")
+        with patch("os.execve", side_effect=OSError("exec format error")), \
+                patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 3
+            with pytest.raises(SystemExit) as exc_info:
+                shape_cli.main()
+
+        assert exc_info.value.code == 3
+        mock_run.assert_called_once_with(
+            [BINARY_PATH, "ready", "--json"], env=os.environ
+        )
+
+    def test_windows_never_execs(self, cli):
+        cli("Windows")
+        with patch("os.execve") as mock_execve, \
+                patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            with pytest.raises(SystemExit):
+                shape_cli.main()
+
+        mock_execve.assert_not_called()
+        mock_run.assert_called_once()
+
+
+class TestMainChmod:
+    """Tests for making the binary executable only when needed."""
+
+    def test_skips_chmod_when_executable(self, cli):
+        cli("Linux")
+        with patch("os.chmod") as mock_chmod, \
+                patch("os.execve", side_effect=_Exec):
+            with pytest.raises(_Exec):
+                shape_cli.main()
+
+        mock_chmod.assert_not_called()
+
+    def test_chmods_when_not_executable(self, cli, monkeypatch):
+        cli("Linux")
+        monkeypatch.setattr(os, "access", lambda path, mode: False)
+        with patch("os.chmod") as mock_chmod, \
+                patch("os.execve", side_effect=_Exec):
+            with pytest.raises(_Exec):
+                shape_cli.main()
+
+        mock_chmod.assert_called_once_with(BINARY_PATH, 0o755)
+
+    def test_windows_never_chmods(self, cli, monkeypatch):
+        cli("Windows")
+        monkeypatch.setattr(os, "access", lambda path, mode: False)
+        with patch("os.chmod") as mock_chmod, \
+                patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            with pytest.raises(SystemExit):
+                shape_cli.main()
+
+        mock_chmod.assert_not_called()
+
+
+class TestGetBinaryPath:
+    """Tests for memoizing the resolved binary path."""
+
+    @pytest.fixture(autouse=True)
+    def _bin_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(shape_cli, "_BIN_DIR", tmp_path)
+        monkeypatch.setattr(shape_cli, "_BINARY_PATH", None)
+        self.binary = tmp_path / shape_cli.BINARY_NAME
+
+    def test_memoizes_after_first_lookup(self):
+        self.binary.write_bytes(b"binary")
+        assert shape_cli.get_binary_path() == str(self.binary)
+
+        # No further filesystem checks once resolved
+        self.binary.unlink()
+        assert shape_cli.get_binary_path() == str(self.binary)
+
+    def test_failed_lookup_is_not_memoized(self):
+        with patch("shape_cli._download.install_binary") as mock_install:
+            with pytest.raises(FileNotFoundError):
+                shape_cli.get_binary_path()
+
+            self.binary.write_bytes(b"binary")
+            assert shape_cli.get_binary_path() == str(self.binary)
+
+        mock_install.assert_called_once()